@@ -8,21 +8,35 @@ different languages, enabling dynamic language switching without requiring a res
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 import logging
+import os
+import re
+import shutil
+import time
+
 import aiohttp
-import async_timeout
+import orjson
 import voluptuous as vol
-import json
-import time
 
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.components import websocket_api
-from homeassistant.helpers import config_validation as cv, aiohttp_client
-from homeassistant.helpers.storage import Store
-
-from .const import DOMAIN, STORAGE_KEY, STORAGE_VERSION, REFRESH_INTERVAL, DEFAULT_BASE_URL
+from homeassistant.components.websocket_api.messages import construct_result_message
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from .const import (
+    DOMAIN,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
+    DEFAULT_BASE_URL,
+    TRANSLATION_CACHE_SIZE,
+)
+from .metadata import build_metadata_response, has_metadata_changed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,57 +53,155 @@ GET_TRANSLATION_SCHEMA = vol.Schema({
     vol.Required('language'): cv.string,
 })
 
-def _has_metadata_changed(old_metadata: dict, new_metadata: dict) -> bool:
+# Language codes used as file names for the on-disk translation cache
+_SAFE_LANGUAGE = re.compile(r"[A-Za-z0-9_-]+")
+
+WS_GET_ALL_METADATA_SCHEMA = {
+    vol.Required("type"): "frontend_translations/get_all_metadata",
+}
+
+WS_GET_LANGUAGE_SCHEMA = {
+    vol.Required("type"): "frontend_translations/get_language",
+    vol.Required("language"): cv.string,
+}
+
+WS_GET_LANGUAGES_SCHEMA = {
+    vol.Required("type"): "frontend_translations/get_languages",
+    vol.Required("languages"): [cv.string],
+}
+
+WS_STORE_METADATA_SCHEMA = {
+    vol.Required("type"): "frontend_translations/store_metadata",
+    vol.Required("metadata"): dict,
+}
+
+def _read_cached_body(path: str) -> bytes | None:
     """
-    Check if translation metadata has changed.
-    
-    This function compares old and new metadata to determine if there are any changes
-    that would require updating the stored metadata.
+    Read a translation file from the on-disk cache.
     
     Args:
-        old_metadata (dict): The currently stored metadata
-        new_metadata (dict): The new metadata to compare against
+        path (str): The cache file path
         
     Returns:
-        bool: True if metadata has changed, False otherwise
+        bytes | None: The file contents, or None if it cannot be read
     """
-    if not old_metadata and new_metadata:
-        return True
+    try:
+        with open(path, "rb") as file:
+            return file.read()
+    except OSError:
+        return None
+
+def _write_cached_body(path: str, body: bytes) -> None:
+    """
+    Write a translation file to the on-disk cache.
+    
+    Args:
+        path (str): The cache file path
+        body (bytes): The translation file contents
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(body)
+    except OSError as err:
+        _LOGGER.warning("Could not cache translation file %s: %s", path, err)
+
+def _storage_data(data: dict) -> dict:
+    """
+    Build the snapshot written to the integration's Store.
+    
+    Args:
+        data (dict): The integration's entry in hass.data
         
-    if len(old_metadata) != len(new_metadata):
-        return True
+    Returns:
+        dict: The metadata, last update time and ETags to persist
+    """
+    return {
+        "metadata": data["metadata"],
+        "last_update": data["last_update"],
+        "etags": data["etags"],
+    }
+
+@callback
+def _async_schedule_save(data: dict) -> None:
+    """
+    Schedule a debounced write of the integration's stored data.
+    
+    Successive calls within STORAGE_SAVE_DELAY seconds collapse into one write,
+    and the Store flushes a pending write on shutdown. The save_pending flag
+    lets async_unload_entry flush only when a write is actually outstanding.
+    
+    Args:
+        data (dict): The integration's entry in hass.data
+    """
+    def _data_to_save() -> dict:
+        data["save_pending"] = False
+        return _storage_data(data)
+
+    data["save_pending"] = True
+    data["store"].async_delay_save(_data_to_save, STORAGE_SAVE_DELAY)
+
+def _get_cached_payload(hass: HomeAssistant, language: str) -> bytes | None:
+    """
+    Look up the cached translation response for a language.
+    
+    The cache key uses the language's current hash, so a stale entry for an
+    outdated hash is never returned.
+    
+    Args:
+        hass (HomeAssistant): The Home Assistant instance
+        language (str): The language code to look up
         
-    for lang, data in new_metadata.items():
-        if lang not in old_metadata:
-            return True
-        if old_metadata[lang].get('hash') != data.get('hash'):
-            return True
-            
-    return False
+    Returns:
+        bytes | None: The JSON-encoded response, or None on a cache miss
+    """
+    lang_data = hass.data[DOMAIN]["metadata"].get(language)
+    if not lang_data or not (lang_hash := lang_data.get('hash')):
+        return None
+    
+    cache = hass.data[DOMAIN]["translation_cache"]
+    cache_key = (language, lang_hash)
+    if (payload := cache.get(cache_key)) is not None:
+        cache.move_to_end(cache_key)
+    return payload
+
+async def _async_close_session(session: aiohttp.ClientSession) -> None:
+    """
+    Close the dedicated translation session.
+    
+    Errors are logged rather than raised so that a broken connection
+    cannot block unloading the integration.
+    
+    Args:
+        session (aiohttp.ClientSession): The session to close
+    """
+    if session.closed:
+        return
+    try:
+        await session.close()
+    except Exception as err:
+        _LOGGER.warning("Error closing translation session: %s", err)
 
-def _get_base_url(hass: HomeAssistant) -> str:
+def _compute_base_url(hass: HomeAssistant, entry: ConfigEntry) -> str:
     """
-    Get the base URL for translation requests.
+    Resolve the base URL for translation requests.
     
     This function determines the appropriate base URL to use for fetching translations,
-    checking configuration entries, options, and Home Assistant URLs in order of preference.
+    checking the entry options, the entry data and Home Assistant URLs in order of preference.
+    The result is cached in hass.data and only recomputed when the entry changes.
     
     Args:
         hass (HomeAssistant): The Home Assistant instance
+        entry (ConfigEntry): The configuration entry
         
     Returns:
         str: The base URL to use for translation requests
     """
-    entries = hass.config_entries.async_entries(DOMAIN)
-    if entries:
-        config_entry = entries[0]
-        if "base_url" in config_entry.data:
-            return config_entry.data["base_url"].rstrip('/')
-        if "base_url" in config_entry.options:
-            return config_entry.options["base_url"].rstrip('/')
-    
-    if DOMAIN in hass.data and "base_url" in hass.data[DOMAIN]:
-        return hass.data[DOMAIN]["base_url"].rstrip('/')
+    # The config and options flows strip trailing slashes on submission
+    if "base_url" in entry.options:
+        return entry.options["base_url"]
+    if "base_url" in entry.data:
+        return entry.data["base_url"]
     
     if hass.config.internal_url:
         return hass.config.internal_url.rstrip('/')
@@ -97,14 +209,14 @@ def _get_base_url(hass: HomeAssistant) -> str:
     if hass.config.external_url:
         return hass.config.external_url.rstrip('/')
     
-    return DEFAULT_BASE_URL.rstrip('/')
+    return DEFAULT_BASE_URL
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """
     Set up the Frontend Translations integration from configuration.
     
-    This function initializes the integration from YAML configuration
-    by creating a config flow.
+    This function registers the WebSocket API endpoints and initializes the
+    integration from YAML configuration by creating a config flow.
     
     Args:
         hass (HomeAssistant): The Home Assistant instance
@@ -113,6 +225,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     Returns:
         bool: True if setup was successful
     """
+    if not hass.data.get(f"{DOMAIN}_ws_registered"):
+        websocket_api.async_register_command(hass, websocket_get_all_metadata)
+        websocket_api.async_register_command(hass, websocket_get_language)
+        websocket_api.async_register_command(hass, websocket_get_languages)
+        websocket_api.async_register_command(hass, websocket_store_metadata)
+        hass.data[f"{DOMAIN}_ws_registered"] = True
+
     if DOMAIN in config:
         hass.async_create_task(
             hass.config_entries.flow.async_init(
@@ -128,7 +247,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Set up the Frontend Translations integration from a config entry.
     
     This function initializes the integration's data structures, loads stored metadata,
-    and registers services and WebSocket API endpoints.
+    and registers services.
     
     Args:
         hass (HomeAssistant): The Home Assistant instance
@@ -140,35 +259,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
     stored_data = await store.async_load() or {"metadata": {}, "last_update": 0}
     
+    metadata_response = build_metadata_response(stored_data["metadata"])
     hass.data[DOMAIN] = {
         "metadata": stored_data["metadata"],
+        "metadata_response": metadata_response,
+        "metadata_response_bytes": orjson.dumps(metadata_response),
         "store": store,
         "last_update": stored_data["last_update"],
-        "base_url": entry.data.get("base_url", DEFAULT_BASE_URL).rstrip('/')
+        "etags": stored_data.get("etags", {}),
+        "save_pending": False,
+        "resolved_base_url": _compute_base_url(hass, entry),
+        "translation_cache": OrderedDict(),
+        # Translation files all come from one host, so they get their own
+        # keep-alive pool instead of competing for the shared HA session.
+        "session": aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=8,
+                limit_per_host=4,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+        ),
     }
 
-    if entry.options:
-        hass.data[DOMAIN]["base_url"] = entry.options.get(
-            "base_url", 
-            hass.data[DOMAIN]["base_url"]
-        ).rstrip('/')
-
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
-    async def fetch_translation(language: str) -> dict:
+    async def _async_close_on_stop(event: Event) -> None:
+        """Close the translation session when Home Assistant shuts down."""
+        await _async_close_session(hass.data[DOMAIN]["session"])
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_on_stop)
+    )
+
+    async def _async_fetch_translation(language: str) -> dict | tuple[bytes, dict | None]:
         """
-        Fetch translation data for a specific language.
+        Fetch the encoded translation response for a specific language.
         
         This function retrieves translation data for the requested language
-        using the stored metadata to construct the appropriate URL.
+        using the stored metadata to construct the appropriate URL. The downloaded
+        file is validated but not re-serialized: it is spliced verbatim into the
+        JSON-encoded response. Encoded responses are kept in a small LRU cache keyed
+        by (language, hash), so a language is only downloaded again once its hash changes.
+        
+        Downloaded files are also kept on disk together with their ETag. After a
+        restart the file is requested with If-None-Match, and a 304 response is
+        served from the disk copy.
         
         Args:
             language (str): The language code to fetch translations for
             
         Returns:
-            dict: A dictionary containing the translation data or error information
+            dict | tuple: A dictionary with error information, or the JSON-encoded
+            success response together with the decoded response. The decoded
+            response is only available after a download and is None on cache hits.
         """
-        metadata = hass.data[DOMAIN]["metadata"]
+        # Captured before any await; the entry may be unloaded or its
+        # metadata replaced by store_metadata while the download runs
+        data = hass.data[DOMAIN]
+        metadata = data["metadata"]
         
         if not metadata or language not in metadata:
             return {"success": False, "error": f"Language {language} not found"}
@@ -177,37 +326,109 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if not lang_hash:
             return {"success": False, "error": f"No hash for {language}"}
 
-        base_url = _get_base_url(hass)
+        lang_entry = data["metadata_response"]["languages"][language]
+
+        if (cached := _get_cached_payload(hass, language)) is not None:
+            return cached, None
+
+        base_url = data["resolved_base_url"]
         translation_url = f"{base_url}/static/translations/{language}-{lang_hash}.json"
         
+        etags = data["etags"]
+        cache_path = None
+        cached_body = None
+        headers = {}
+        if _SAFE_LANGUAGE.fullmatch(language):
+            cache_path = hass.config.path(STORAGE_DIR, DOMAIN, f"{language}.json")
+            known = etags.get(language)
+            if known and known["hash"] == lang_hash:
+                cached_body = await hass.async_add_executor_job(_read_cached_body, cache_path)
+                if cached_body is not None:
+                    headers["If-None-Match"] = known["etag"]
+
         try:
-            websession = aiohttp_client.async_get_clientsession(hass)
-            async with async_timeout.timeout(10):
-                response = await websession.get(translation_url)
-                
-                if response.status != 200:
+            websession = data["session"]
+            async with (
+                asyncio.timeout(10),
+                websession.get(translation_url, headers=headers) as response,
+            ):
+                if response.status == 304 and cached_body is not None:
+                    raw = cached_body
+                elif response.status != 200:
                     return {
                         "success": False, 
                         "error": f"HTTP error {response.status}"
                     }
-                    
-                data = await response.json()
-                return {
-                    "success": True,
-                    "language": language,
-                    "nativeName": metadata[language].get('nativeName', language),
-                    "isRTL": metadata[language].get('isRTL', False),
-                    "hash": lang_hash,
-                    "data": data
-                }
+                else:
+                    raw = await response.read()
+                etag = response.headers.get("ETag")
+
+            # The body is forwarded as-is; the parse validates it and is kept
+            # for callers that need Python objects
+            body = orjson.loads(raw)
+
+            if cache_path and raw is not cached_body and etag:
+                await hass.async_add_executor_job(_write_cached_body, cache_path, raw)
+                etags[language] = {"hash": lang_hash, "etag": etag}
+                _async_schedule_save(data)
+
+            # Reuse the entry prebuilt for get_all_metadata for the shared fields
+            header = orjson.dumps({
+                "success": True,
+                "language": language,
+                **lang_entry,
+            })
+            payload = b"".join((header[:-1], b',"data":', raw, b"}"))
+                
+            cache = data["translation_cache"]
+            cache[(language, lang_hash)] = payload
+            if len(cache) > TRANSLATION_CACHE_SIZE:
+                cache.popitem(last=False)
+            return payload, {"success": True, "language": language, **lang_entry, "data": body}
                 
-        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+        except (TimeoutError, aiohttp.ClientError) as err:
             _LOGGER.error("Error fetching translation: %s", err)
             return {"success": False, "error": str(err)}
-        except json.JSONDecodeError as err:
+        except orjson.JSONDecodeError as err:
             _LOGGER.error("JSON decode error: %s", err)
             return {"success": False, "error": "Invalid JSON response"}
 
+    async def fetch_translation_payload(language: str) -> bytes | dict:
+        """
+        Fetch the encoded translation response for a specific language.
+        
+        Args:
+            language (str): The language code to fetch translations for
+            
+        Returns:
+            bytes | dict: The JSON-encoded success response, or a dictionary with error information
+        """
+        result = await _async_fetch_translation(language)
+        if isinstance(result, dict):
+            return result
+        return result[0]
+
+    async def fetch_translation(language: str) -> dict:
+        """
+        Fetch translation data for a specific language.
+        
+        A fresh download reuses the dict decoded while validating the file;
+        only a cached response has to be decoded here.
+        
+        Args:
+            language (str): The language code to fetch translations for
+            
+        Returns:
+            dict: A dictionary containing the translation data or error information
+        """
+        result = await _async_fetch_translation(language)
+        if isinstance(result, dict):
+            return result
+        payload, decoded = result
+        if decoded is not None:
+            return decoded
+        return orjson.loads(payload)
+
     async def handle_get_translation(call: ServiceCall) -> dict:
         """
         Service handler for getting translation data.
@@ -231,11 +452,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         supports_response=True
     )
 
-    websocket_api.async_register_command(hass, websocket_get_all_metadata)
-    websocket_api.async_register_command(hass, websocket_get_language)
-    websocket_api.async_register_command(hass, websocket_store_metadata)
-
     hass.data[DOMAIN]["fetch_translation"] = fetch_translation
+    hass.data[DOMAIN]["fetch_translation_payload"] = fetch_translation_payload
 
     return True
 
@@ -244,17 +462,17 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     Handle options update.
     
     This function is called when the integration's options are updated through the UI.
-    It updates the base_url if it has changed in the options.
+    It re-resolves the cached base_url from the updated entry.
     
     Args:
         hass (HomeAssistant): The Home Assistant instance
         entry (ConfigEntry): The updated configuration entry
     """
-    if entry.options:
-        hass.data[DOMAIN]["base_url"] = entry.options.get(
-            "base_url", 
-            hass.data[DOMAIN]["base_url"]
-        ).rstrip('/')
+    _LOGGER.debug("Options updated: %s", entry.options)
+    
+    # Re-resolve the cached base URL from the updated entry
+    hass.data[DOMAIN]["resolved_base_url"] = _compute_base_url(hass, entry)
+    _LOGGER.debug("Resolved base_url: %s", hass.data[DOMAIN]["resolved_base_url"])
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
@@ -269,11 +487,39 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Returns:
         bool: True if unload was successful
     """
+    # Unregister service
     hass.services.async_remove(DOMAIN, 'get_translation')
-    hass.data.pop(DOMAIN, None)
+    
+    # Remove data from hass.data and close the translation session
+    data = hass.data.pop(DOMAIN, None)
+    if data is not None:
+        try:
+            # Flush a pending debounced save so a reload does not load stale data
+            if data["save_pending"]:
+                await data["store"].async_save(_storage_data(data))
+        finally:
+            if (session := data.get("session")) is not None:
+                await _async_close_session(session)
+    
     return True
 
-@websocket_api.websocket_command({vol.Required("type"): "frontend_translations/get_all_metadata"})
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """
+    Clean up persistent data when the integration is deleted.
+    
+    This function removes the on-disk translation cache and the stored
+    metadata and ETags, which would otherwise outlive the integration.
+    
+    Args:
+        hass (HomeAssistant): The Home Assistant instance
+        entry (ConfigEntry): The configuration entry being deleted
+    """
+    await hass.async_add_executor_job(
+        shutil.rmtree, hass.config.path(STORAGE_DIR, DOMAIN), True
+    )
+    await Store(hass, STORAGE_VERSION, STORAGE_KEY).async_remove()
+
+@websocket_api.websocket_command(WS_GET_ALL_METADATA_SCHEMA)
 @callback
 def websocket_get_all_metadata(
     hass: HomeAssistant,
@@ -284,31 +530,27 @@ def websocket_get_all_metadata(
     WebSocket API endpoint to get all available language metadata.
     
     This endpoint returns metadata for all available languages, including
-    native names, RTL status, and content hashes.
+    native names, RTL status, and content hashes. The response is encoded
+    once when metadata is stored and sent as-is.
     
     Args:
         hass (HomeAssistant): The Home Assistant instance
         connection (websocket_api.ActiveConnection): The active WebSocket connection
         msg (dict): The received message
     """
-    metadata = hass.data[DOMAIN].get("metadata", {})
-    connection.send_result(msg["id"], {
-        "languages": {
-            lang: {
-                "nativeName": data.get("nativeName", lang),
-                "isRTL": data.get("isRTL", False),
-                "hash": data.get("hash", "")
-            }
-            for lang, data in metadata.items()
-        }
-    })
-
-@websocket_api.websocket_command({
-    vol.Required("type"): "frontend_translations/get_language",
-    vol.Required("language"): cv.string
-})
-@websocket_api.async_response
-async def websocket_get_language(
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Frontend Translations is not set up"
+        )
+        return
+
+    connection.send_message(
+        construct_result_message(msg["id"], hass.data[DOMAIN]["metadata_response_bytes"])
+    )
+
+@websocket_api.websocket_command(WS_GET_LANGUAGE_SCHEMA)
+@callback
+def websocket_get_language(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict
@@ -316,177 +558,99 @@ async def websocket_get_language(
     """
     WebSocket API endpoint to get translation data for a specific language.
     
-    This endpoint retrieves the translation data for a requested language
-    using the fetch_translation helper function.
+    Cached translations are sent straight from the handler. Only a cache miss
+    schedules a task that downloads the translation.
     
     Args:
         hass (HomeAssistant): The Home Assistant instance
         connection (websocket_api.ActiveConnection): The active WebSocket connection
         msg (dict): The received message containing the language parameter
     """
-    fetch_translation = hass.data[DOMAIN]["fetch_translation"]
-    result = await fetch_translation(msg["language"])
-    connection.send_result(msg["id"], result)
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Frontend Translations is not set up"
+        )
+        return
+
+    payload = _get_cached_payload(hass, msg["language"])
+    if payload is not None:
+        connection.send_message(construct_result_message(msg["id"], payload))
+        return
+    
+    _websocket_fetch_language(hass, connection, msg)
 
-@websocket_api.websocket_command({
-    vol.Required("type"): "frontend_translations/store_metadata",
-    vol.Required("metadata"): dict
-})
 @websocket_api.async_response
-async def websocket_store_metadata(
+async def _websocket_fetch_language(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict
 ) -> None:
     """
-    THIS IS AN INTERNAL METHOD, DON'T USE IT!!!
+    Fetch a translation that is not cached yet and send it.
     
-    WebSocket API endpoint to store translation metadata.
-    
-    This endpoint receives and stores metadata about available translations.
-    It checks if the metadata has changed before saving it to avoid unnecessary updates.
+    This is the slow path of websocket_get_language, run as a task by
+    websocket_api.async_response.
     
     Args:
         hass (HomeAssistant): The Home Assistant instance
         connection (websocket_api.ActiveConnection): The active WebSocket connection
-        msg (dict): The received message containing the metadata
-    """
-    try:
-        current_metadata = hass.data[DOMAIN].get("metadata", {})
-        new_metadata = msg["metadata"]
-        
-        if not _has_metadata_changed(current_metadata, new_metadata):
-            return connection.send_result(msg["id"], {"unchanged": True})
-
-        hass.data[DOMAIN]["metadata"] = new_metadata
-        hass.data[DOMAIN]["last_update"] = time.time()
-
-        await hass.data[DOMAIN]["store"].async_save({
-            "metadata": new_metadata,
-            "last_update": hass.data[DOMAIN]["last_update"]
-        })
-
-        connection.send_result(msg["id"], {"success": True})
-    except Exception as e:
-        _LOGGER.error("Error storing metadata: %s", e)
-        connection.send_error(msg["id"], "storage_error", str(e))
-
-    # Register service for getting translations
-    hass.services.async_register(
-        DOMAIN, 
-        'get_translation', 
-        handle_get_translation,
-        schema=GET_TRANSLATION_SCHEMA,
-        supports_response=True,
-    )
-    
-    # Register WebSocket API endpoints
-    websocket_api.async_register_command(hass, websocket_get_all_metadata)
-    websocket_api.async_register_command(hass, websocket_get_language)
-    websocket_api.async_register_command(hass, websocket_store_metadata)
-    
-    # Save helper function in hass.data for use in WebSocket API
-    hass.data[DOMAIN]["fetch_translation"] = fetch_translation
-    
-    _LOGGER.info("Frontend Translations integration setup completed")
-    return True
-
-async def async_update_options(hass: HomeAssistant, entry: ConfigEntry):
-    """
-    Handle options update.
-    
-    This function is called when the integration's options are updated through the UI.
-    It updates the base_url if it has changed in the options.
-    
-    Args:
-        hass (HomeAssistant): The Home Assistant instance
-        entry (ConfigEntry): The updated configuration entry
-    """
-    _LOGGER.debug("Options updated: %s", entry.options)
-    
-    # Update baseUrl if it changed in options
-    if "base_url" in entry.options:
-        hass.data[DOMAIN]["base_url"] = entry.options["base_url"]
-        _LOGGER.debug("Updated base_url from options: %s", entry.options["base_url"])
-
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """
-    Unload the integration when removed via UI.
-    
-    This function cleans up resources used by the integration when it's removed.
-    
-    Args:
-        hass (HomeAssistant): The Home Assistant instance
-        entry (ConfigEntry): The configuration entry being removed
-        
-    Returns:
-        bool: True if unload was successful
+        msg (dict): The received message containing the language parameter
     """
-    # Unregister service
-    hass.services.async_remove(DOMAIN, 'get_translation')
+    fetch_translation_payload = hass.data[DOMAIN]["fetch_translation_payload"]
     
-    # Remove data from hass.data
-    hass.data.pop(DOMAIN)
-    
-    return True
+    payload = await fetch_translation_payload(msg["language"])
+    if isinstance(payload, dict):
+        connection.send_result(msg["id"], payload)
+    else:
+        connection.send_message(construct_result_message(msg["id"], payload))
 
-@websocket_api.websocket_command({
-    vol.Required("type"): "frontend_translations/get_all_metadata",
-})
+@websocket_api.websocket_command(WS_GET_LANGUAGES_SCHEMA)
 @websocket_api.async_response
-async def websocket_get_all_metadata(hass, connection, msg):
+async def websocket_get_languages(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict
+) -> None:
     """
-    WebSocket API endpoint to get all available language metadata.
+    WebSocket API endpoint to get translation data for several languages at once.
     
-    This endpoint returns metadata for all available languages, including
-    native names, RTL status, and content hashes.
+    This endpoint fetches all requested languages concurrently, so a cold request
+    for the current language and its fallbacks costs one round of downloads.
+    The result maps each language code to the same response get_language returns.
     
     Args:
         hass (HomeAssistant): The Home Assistant instance
         connection (websocket_api.ActiveConnection): The active WebSocket connection
-        msg (dict): The received message
+        msg (dict): The received message containing the list of languages
     """
-    metadata = hass.data[DOMAIN].get("metadata", {})
-    
-    languages = {}
-    for lang_code, lang_data in metadata.items():
-        languages[lang_code] = {
-            "nativeName": lang_data.get("nativeName", lang_code),
-            "isRTL": lang_data.get("isRTL", False),
-            "hash": lang_data.get("hash", "")
-        }
-    
-    connection.send_result(msg["id"], {"languages": languages})
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Frontend Translations is not set up"
+        )
+        return
 
-@websocket_api.websocket_command({
-    vol.Required("type"): "frontend_translations/get_language",
-    vol.Required("language"): cv.string,
-})
-@websocket_api.async_response
-async def websocket_get_language(hass, connection, msg):
-    """
-    WebSocket API endpoint to get translation data for a specific language.
+    languages = list(dict.fromkeys(msg["languages"]))
+    fetch_translation_payload = hass.data[DOMAIN]["fetch_translation_payload"]
     
-    This endpoint retrieves the translation data for a requested language
-    using the fetch_translation helper function.
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(fetch_translation_payload(language)) for language in languages]
     
-    Args:
-        hass (HomeAssistant): The Home Assistant instance
-        connection (websocket_api.ActiveConnection): The active WebSocket connection
-        msg (dict): The received message containing the language parameter
-    """
-    language = msg["language"]
-    fetch_translation = hass.data[DOMAIN]["fetch_translation"]
+    parts = []
+    for language, task in zip(languages, tasks):
+        payload = task.result()
+        if isinstance(payload, dict):
+            payload = orjson.dumps(payload)
+        parts.append(orjson.dumps(language) + b":" + payload)
     
-    result = await fetch_translation(language)
-    connection.send_result(msg["id"], result)
+    connection.send_message(construct_result_message(msg["id"], b"{" + b",".join(parts) + b"}"))
 
-@websocket_api.websocket_command({
-    vol.Required("type"): "frontend_translations/store_metadata",
-    vol.Required("metadata"): dict,
-})
-@websocket_api.async_response
-async def websocket_store_metadata(hass, connection, msg):
+@websocket_api.websocket_command(WS_STORE_METADATA_SCHEMA)
+@callback
+def websocket_store_metadata(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict
+) -> None:
     """
     THIS IS AN INTERNAL METHOD, DON'T USE IT!!!
     
@@ -500,24 +664,26 @@ async def websocket_store_metadata(hass, connection, msg):
         connection (websocket_api.ActiveConnection): The active WebSocket connection
         msg (dict): The received message containing the metadata
     """
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Frontend Translations is not set up"
+        )
+        return
+
+    metadata = msg["metadata"]
+
     try:
-        metadata = msg["metadata"]
-        
-        # Get current metadata
-        current_metadata = hass.data[DOMAIN].get("metadata", {})
-        
         # Check if metadata has changed
-        if _has_metadata_changed(current_metadata, metadata):
+        if has_metadata_changed(hass.data[DOMAIN]["metadata"], metadata):
             # Save metadata
             hass.data[DOMAIN]["metadata"] = metadata
+            metadata_response = build_metadata_response(metadata)
+            hass.data[DOMAIN]["metadata_response"] = metadata_response
+            hass.data[DOMAIN]["metadata_response_bytes"] = orjson.dumps(metadata_response)
             hass.data[DOMAIN]["last_update"] = time.time()
             
-            # Asynchronously save to storage
-            store = hass.data[DOMAIN]["store"]
-            await store.async_save({
-                "metadata": metadata,
-                "last_update": hass.data[DOMAIN]["last_update"]
-            })
+            # Debounced save; the Store flushes pending writes on shutdown
+            _async_schedule_save(hass.data[DOMAIN])
             
             _LOGGER.info("Translation metadata updated with %d languages", len(metadata))
             connection.send_result(msg["id"], {"success": True})
@@ -122,7 +122,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         current_url = self.config_entry.options.get(
             "base_url",
             self.config_entry.data.get("base_url", DEFAULT_BASE_URL)
-        ).rstrip('/')
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -3,5 +3,7 @@
 DOMAIN = "frontend_translations"
 STORAGE_KEY = f"{DOMAIN}.storage"
 STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
 REFRESH_INTERVAL = 86400
 DEFAULT_BASE_URL = "http://homeassistant.local:8123"
+TRANSLATION_CACHE_SIZE = 8
@@ -0,0 +1,55 @@
+"""Translation metadata helpers for the Frontend Translations integration."""
+from __future__ import annotations
+
+from typing import Any
+
+def has_metadata_changed(
+    old_metadata: dict[str, dict[str, Any]],
+    new_metadata: dict[str, dict[str, Any]],
+) -> bool:
+    """
+    Check if translation metadata has changed.
+    
+    Only language codes and content hashes are compared. The walk stops at the
+    first difference, so changed metadata is usually detected early.
+    
+    Args:
+        old_metadata (dict): The currently stored metadata
+        new_metadata (dict): The new metadata to compare against
+        
+    Returns:
+        bool: True if metadata has changed, False otherwise
+    """
+    if len(old_metadata) != len(new_metadata):
+        return True
+        
+    for lang, data in new_metadata.items():
+        old_data = old_metadata.get(lang)
+        if old_data is None or old_data.get('hash') != data.get('hash'):
+            return True
+            
+    return False
+
+def build_metadata_response(metadata: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    Build the get_all_metadata response for the given metadata.
+    
+    The response only changes when metadata is stored, so it is built once
+    and kept in hass.data instead of being rebuilt on every request.
+    
+    Args:
+        metadata (dict): The stored translation metadata
+        
+    Returns:
+        dict: The response payload with native names, RTL flags and hashes
+    """
+    return {
+        "languages": {
+            lang: {
+                "nativeName": data.get("nativeName", lang),
+                "isRTL": data.get("isRTL", False),
+                "hash": data.get("hash", "")
+            }
+            for lang, data in metadata.items()
+        }
+    }